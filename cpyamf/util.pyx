@@ -923,6 +923,8 @@ cdef class BufferedByteStream(cBufferedByteStream):
             self.write(x.getvalue())
         elif isinstance(buf, (bytes, str)):
             self.write(buf)
+        elif isinstance(buf, (bytearray, memoryview)):
+            self.write(bytes(buf))
         elif hasattr(buf, 'getvalue'):
             self.write(buf.getvalue())
         elif hasattr(buf, 'read') and hasattr(buf, 'seek') and hasattr(buf, 'tell'):
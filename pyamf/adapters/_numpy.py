@@ -0,0 +1,36 @@
+# Copyright (c) The PyAMF Project.
+# See LICENSE.txt for details.
+
+"""
+U{NumPy<http://www.numpy.org>} adapter module.
+
+Converts C{numpy.ndarray} instances to (nested) lists and NumPy scalars to
+their Python equivalents before encoding. The conversion is done by NumPy in
+a single pass over the array, rather than by iterating it element by element
+and encoding each NumPy scalar as an object. Type information (dtype, shape)
+is lost.
+
+@since: 0.8.11
+"""
+
+import numpy
+
+import pyamf
+
+
+def ndarray_to_list(obj, encoder):
+    """
+    Converts a C{numpy.ndarray} to a C{list} of native Python values.
+    """
+    return obj.tolist()
+
+
+def generic_to_python(obj, encoder):
+    """
+    Converts a NumPy scalar to the native Python value.
+    """
+    return obj.item()
+
+
+pyamf.add_type(numpy.ndarray, ndarray_to_list)
+pyamf.add_type(numpy.generic, generic_to_python)
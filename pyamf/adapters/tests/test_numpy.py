@@ -0,0 +1,55 @@
+# Copyright (c) The PyAMF Project.
+# See LICENSE.txt for details.
+
+"""
+Tests for the L{numpy} L{pyamf.adapters._numpy} module.
+
+@since: 0.8.11
+"""
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+import unittest
+
+import pyamf
+
+
+class NumpyTestCase(unittest.TestCase):
+    """
+    """
+
+    def setUp(self):
+        if not numpy:
+            self.skipTest("'numpy' not available")
+
+    def encdec(self, obj, encoding):
+        return next(pyamf.decode(
+            pyamf.encode(obj, encoding=encoding),
+            encoding=encoding))
+
+    def test_float_array(self):
+        obj = numpy.array([1.5, 2.5, 3.5])
+
+        for encoding in pyamf.ENCODING_TYPES:
+            self.assertEqual(self.encdec(obj, encoding), [1.5, 2.5, 3.5])
+
+    def test_int_array(self):
+        obj = numpy.arange(3, dtype=numpy.int64)
+
+        for encoding in pyamf.ENCODING_TYPES:
+            self.assertEqual(self.encdec(obj, encoding), [0, 1, 2])
+
+    def test_2d_array(self):
+        obj = numpy.array([[1, 2], [3, 4]], dtype=numpy.int32)
+
+        for encoding in pyamf.ENCODING_TYPES:
+            self.assertEqual(self.encdec(obj, encoding), [[1, 2], [3, 4]])
+
+    def test_scalar(self):
+        for encoding in pyamf.ENCODING_TYPES:
+            self.assertEqual(self.encdec(numpy.int32(7), encoding), 7)
+            self.assertEqual(self.encdec(numpy.float32(0.5), encoding), 0.5)
+            self.assertEqual(self.encdec(numpy.bool_(True), encoding), True)
@@ -7,27 +7,401 @@ Remoting client implementation.
 @since: 0.1
 """
 
-from urllib.error import URLError
-from urllib.parse import urlparse
-from urllib.request import Request, urlopen
+import base64
+import collections
+import threading
+import time
+from concurrent import futures
+from http import client as http_client
+from urllib.error import HTTPError, URLError
+from urllib.parse import unquote, urlparse, urlsplit
+from urllib.request import Request, getproxies, proxy_bypass
 
 import pyamf
 from pyamf import remoting
 
 try:
-    from gzip import GzipFile
+    import gzip
 except ImportError:
-    GzipFile = False
-
-try:
-    from cStringIO import StringIO as BytesIO
-except ImportError:
-    from io import BytesIO
+    gzip = None
 
 
 #: Default user agent is `PyAMF/x.x(.x)`.
 DEFAULT_USER_AGENT = 'PyAMF/%s' % (pyamf.version,)
 
+#: HTTP headers that are the same for every request to a gateway.
+EXECUTE_HEADERS = {
+    'Content-Type': remoting.CONTENT_TYPE,
+}
+
+#: HTTP headers sent to the gateway unless overridden with
+#: L{RemotingService.addHTTPHeader}.
+DEFAULT_HTTP_HEADERS = {}
+
+if gzip:
+    DEFAULT_HTTP_HEADERS['Accept-Encoding'] = 'gzip'
+
+#: Encoded request bodies larger than this (in bytes) are gzipped when
+#: compression is enabled on the L{RemotingService}.
+DEFAULT_COMPRESS_THRESHOLD = 1024
+
+#: Errors that signal a pooled persistent connection has gone stale and the
+#: request should be retried on a fresh socket.
+RECONNECT_ERRORS = (
+    http_client.CannotSendRequest,
+    http_client.BadStatusLine,
+    OSError,
+)
+
+#: Number of seconds an idle pooled connection is kept before it is
+#: discarded.
+POOL_IDLE_TIMEOUT = 60
+
+#: Maximum number of idle connections kept per host, the oldest are closed
+#: first.
+POOL_MAX_IDLE = 8
+
+#: Idle persistent connections shared by all L{HTTPConnectionOpener}s, keyed
+#: on C{(scheme, host, port, tunnel_host)}.
+_CONNECTION_POOL = {}
+_CONNECTION_POOL_LOCK = threading.Lock()
+
+
+class StreamBody(object):
+    """
+    A read-only file-like view of an encoded AMF stream, used as the body of
+    an HTTP request so that the stream can be sent in chunks rather than
+    copied into a string first. Unlike
+    L{BufferedByteStream<pyamf.util.BufferedByteStream>}, reading past the
+    end returns what is left (or C{b''}) instead of raising.
+
+    @ivar stream: The encoded stream.
+    @type stream: L{BufferedByteStream<pyamf.util.BufferedByteStream>}
+    @since: 0.8.11
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def __len__(self):
+        return len(self.stream)
+
+    def read(self, size=-1):
+        remaining = self.stream.remaining()
+
+        if size < 0 or size > remaining:
+            size = remaining
+
+        if size == 0:
+            return b''
+
+        return self.stream.read(size)
+
+    def seek(self, pos, mode=0):
+        return self.stream.seek(pos, mode)
+
+    def tell(self):
+        return self.stream.tell()
+
+    def getvalue(self):
+        return self.stream.getvalue()
+
+
+class PooledResponse(object):
+    """
+    Wraps a C{http.client.HTTPResponse}, handing the connection it was read
+    from back to the connection pool once the body has been consumed.
+
+    @ivar response: The wrapped response.
+    @type response: C{http.client.HTTPResponse}
+    @since: 0.8.11
+    """
+
+    def __init__(self, response, key, connection):
+        self.response = response
+        self.key = key
+        self.connection = connection
+
+    def __getattr__(self, name):
+        return getattr(self.response, name)
+
+    def _release(self):
+        if self.connection is None:
+            return
+
+        release_connection(self.key, self.connection)
+        self.connection = None
+
+    def _discard(self):
+        self.response.close()
+
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def info(self):
+        return self.response.info()
+
+    def read(self, amt=None):
+        try:
+            bytes = self.response.read(amt)
+        except http_client.HTTPException:
+            # e.g. IncompleteRead, the connection must not be reused
+            self._discard()
+
+            raise
+
+        if self.response.isclosed():
+            self._release()
+
+        return bytes
+
+    def close(self):
+        """
+        Closes the response. If the body was not read to the end the
+        underlying connection is unusable and is discarded.
+        """
+        if self.response.isclosed():
+            self._release()
+        else:
+            self._discard()
+
+
+def get_connection(key, factory):
+    """
+    Returns an idle connection for C{key} from the connection pool, or a new
+    one built by calling C{factory} if none is available. Connections that
+    have been idle for longer than L{POOL_IDLE_TIMEOUT} are discarded.
+
+    @param key: C{(scheme, host, port, tunnel_host)}
+    @return: C{(connection, reused)}, C{reused} is C{True} if the connection
+        came from the pool, i.e. it has already served a request.
+    @since: 0.8.11
+    """
+    now = time.time()
+    stale = []
+    connection = None
+
+    with _CONNECTION_POOL_LOCK:
+        idle = _CONNECTION_POOL.get(key, None)
+
+        if idle:
+            fresh = []
+
+            for entry in idle:
+                if now - entry[1] <= POOL_IDLE_TIMEOUT:
+                    fresh.append(entry)
+                else:
+                    stale.append(entry[0])
+
+            # most recently used last
+            if fresh:
+                connection = fresh.pop()[0]
+
+            idle[:] = fresh
+
+    for old in stale:
+        old.close()
+
+    if connection is None:
+        return factory(), False
+
+    return connection, True
+
+
+def release_connection(key, connection):
+    """
+    Returns an idle C{connection} to the connection pool so that it can be
+    reused by any L{HTTPConnectionOpener} talking to the same host. At most
+    L{POOL_MAX_IDLE} connections are kept per key.
+
+    @since: 0.8.11
+    """
+    with _CONNECTION_POOL_LOCK:
+        idle = _CONNECTION_POOL.setdefault(key, [])
+        idle.append((connection, time.time()))
+
+        excess = idle[:-POOL_MAX_IDLE]
+        del idle[:-POOL_MAX_IDLE]
+
+    for old, last_used in excess:
+        old.close()
+
+
+def clear_connection_pool():
+    """
+    Closes and forgets all idle pooled connections.
+
+    @since: 0.8.11
+    """
+    with _CONNECTION_POOL_LOCK:
+        idle = list(_CONNECTION_POOL.values())
+        _CONNECTION_POOL.clear()
+
+    for connections in idle:
+        for connection, last_used in connections:
+            connection.close()
+
+
+class HTTPConnectionOpener(object):
+    """
+    Opens C{urllib.request.Request} objects over persistent HTTP/1.1
+    connections so that consecutive calls to the same gateway reuse the
+    underlying TCP (and TLS) connection instead of paying a handshake each
+    time. This is the default L{opener<RemotingService.opener>}.
+
+    Idle connections are kept in a pool shared by all openers, so several
+    L{RemotingService} instances talking to the same host share sockets. A
+    connection is returned to the pool once its response has been read to
+    the end.
+
+    Like C{urlopen}, proxies are taken from the C{<scheme>_proxy} environment
+    variables unless one was set on the request, and C{no_proxy} is
+    honoured. Unlike C{urlopen}, redirects are not followed; a 3xx response
+    raises C{HTTPError}.
+
+    @ivar proxies: Maps a URL scheme to a proxy URL. Defaults to
+        C{urllib.request.getproxies()}.
+    @type proxies: C{dict}
+    @since: 0.8.11
+    """
+
+    connection_types = {
+        'http': http_client.HTTPConnection,
+        'https': http_client.HTTPSConnection,
+    }
+
+    #: Size of the chunks a file-like request body is sent in.
+    blocksize = 65536
+
+    def __init__(self, proxies=None):
+        if proxies is None:
+            proxies = getproxies()
+
+        self.proxies = proxies
+        self._keys = {}
+
+    def _set_proxy(self, request):
+        """
+        Applies the configured proxy for the scheme of C{request}, the way
+        C{urllib.request.ProxyHandler} does.
+        """
+        if request.has_proxy():
+            return
+
+        proxy = self.proxies.get(request.type)
+
+        if not proxy or proxy_bypass(request.host):
+            return
+
+        if '://' not in proxy:
+            proxy = 'http://' + proxy
+
+        proxy = urlsplit(proxy)
+
+        if proxy.username is not None:
+            credentials = '%s:%s' % (
+                unquote(proxy.username), unquote(proxy.password or '')
+            )
+            request.add_header(
+                'Proxy-authorization',
+                'Basic ' + base64.b64encode(credentials.encode()).decode()
+            )
+
+        request.set_proxy(proxy.netloc.rpartition('@')[2], proxy.scheme)
+
+    def _get_key(self, request):
+        """
+        Returns the connection pool key for C{request}. The host and port are
+        parsed once per distinct host and cached.
+        """
+        try:
+            return self._keys[request.type, request.host, request._tunnel_host]
+        except KeyError:
+            pass
+
+        address = urlsplit('//' + request.host)
+        port = address.port or self.connection_types[request.type].default_port
+        key = (request.type, address.hostname, port, request._tunnel_host)
+
+        self._keys[request.type, request.host, request._tunnel_host] = key
+
+        return key
+
+    def _make_connection(self, request):
+        connection = self.connection_types[request.type](request.host)
+        # only honoured from Python 3.7, older versions send 8 KiB blocks
+        connection.blocksize = self.blocksize
+
+        if request._tunnel_host:
+            headers = {}
+            auth = request.get_header('Proxy-authorization')
+
+            if auth:
+                headers['Proxy-Authorization'] = auth
+
+            connection.set_tunnel(request._tunnel_host, headers=headers)
+
+        return connection
+
+    def __call__(self, request):
+        self._set_proxy(request)
+
+        key = self._get_key(request)
+        connection, reused = get_connection(
+            key, lambda: self._make_connection(request)
+        )
+
+        headers = dict(request.header_items())
+        headers['Connection'] = 'keep-alive'
+
+        if request._tunnel_host:
+            # only the CONNECT request is meant for the proxy
+            headers.pop('Proxy-authorization', None)
+
+        while True:
+            if hasattr(request.data, 'seek'):
+                request.data.seek(0)
+
+            try:
+                connection.request(
+                    request.get_method(),
+                    request.selector,
+                    request.data,
+                    headers
+                )
+                response = connection.getresponse()
+            except RECONNECT_ERRORS as e:
+                connection.close()
+
+                # AMF calls are not idempotent. Only a pooled connection that
+                # the server may have dropped while idle is worth a second
+                # attempt, on a fresh socket.
+                if not reused:
+                    raise URLError(e)
+
+                reused = False
+            except http_client.HTTPException as e:
+                # a malformed response, e.g. LineTooLong
+                connection.close()
+
+                raise URLError(e)
+            else:
+                break
+
+        response = PooledResponse(response, key, connection)
+
+        if not 200 <= response.status < 300:
+            raise HTTPError(
+                request.full_url,
+                response.status,
+                response.reason,
+                response.msg,
+                response
+            )
+
+        return response
+
 
 class ServiceMethodProxy(object):
     """
@@ -41,9 +415,12 @@ class ServiceMethodProxy(object):
     @see: L{ServiceProxy.__getattr__}
     """
 
+    __slots__ = ('service', 'name', '_full_name')
+
     def __init__(self, service, name):
         self.service = service
         self.name = name
+        self._full_name = None
 
     def __call__(self, *args):
         """
@@ -55,14 +432,15 @@ class ServiceMethodProxy(object):
     def __str__(self):
         """
         Returns the full service name, including the method name if there is
-        one.
+        one. The name is built once and cached.
         """
-        service_name = str(self.service)
-
-        if self.name is not None:
-            service_name = '%s.%s' % (service_name, self.name)
+        if self._full_name is None:
+            if self.name is None:
+                self._full_name = str(self.service)
+            else:
+                self._full_name = '%s.%s' % (self.service, self.name)
 
-        return service_name
+        return self._full_name
 
 
 class ServiceProxy(object):
@@ -80,17 +458,32 @@ class ServiceProxy(object):
         is called, the AMF request is immediately sent to the remote gateway
         and a response is returned. If set to C{False}, a L{RequestWrapper}
         is returned, waiting for the underlying gateway to fire the
-        L{execute <RemotingService.execute>} method.
+        L{execute <RemotingService.execute>} method. Use C{False} when making
+        many calls so they share one HTTP round trip.
     @type _auto_execute: C{bool}
+    @ivar _methods: L{ServiceMethodProxy} instances already handed out, keyed
+        on method name.
+    @type _methods: C{dict}
     """
 
+    __slots__ = ('_gw', '_name', '_auto_execute', '_methods')
+
     def __init__(self, gw, name, auto_execute=True):
         self._gw = gw
         self._name = name
         self._auto_execute = auto_execute
+        self._methods = {}
+
+    def _getMethod(self, name):
+        try:
+            return self._methods[name]
+        except KeyError:
+            method = self._methods[name] = ServiceMethodProxy(self, name)
+
+            return method
 
     def __getattr__(self, name):
-        return ServiceMethodProxy(self, name)
+        return self._getMethod(name)
 
     def _call(self, method_proxy, *args):
         """
@@ -104,10 +497,7 @@ class ServiceProxy(object):
 
             if response.status == remoting.STATUS_ERROR:
                 if hasattr(response.body, 'raiseException'):
-                    try:
-                        response.body.raiseException()
-                    except:
-                        raise
+                    response.body.raiseException()
                 else:
                     raise remoting.RemotingError
 
@@ -119,7 +509,7 @@ class ServiceProxy(object):
         """
         This allows services to be 'called' without a method name.
         """
-        return self._call(ServiceMethodProxy(self, None), *args)
+        return self._call(self._getMethod(None), *args)
 
     def __str__(self):
         """
@@ -134,20 +524,40 @@ class RequestWrapper(object):
 
     @ivar gw: The underlying gateway.
     @type gw: L{RemotingService}
-    @ivar id: The id of the request.
+    @ivar id: The id of the request, as used in the AMF envelope. If the
+        wrapper was created with a request number, this is C{'/<number>'},
+        built the first time it is needed.
     @type id: C{str}
+    @ivar number: The request number, if the wrapper was created with one.
+    @type number: C{int} or C{None}
     @ivar service: The service proxy.
     @type service: L{ServiceProxy}
     @ivar args: The args used to invoke the call.
     @type args: C{list}
     """
 
+    __slots__ = ('gw', 'number', '_id', 'service', 'args', 'response')
+
     def __init__(self, gw, id_, service, *args):
         self.gw = gw
-        self.id = id_
         self.service = service
         self.args = args
 
+        if isinstance(id_, int):
+            self.number = id_
+            self._id = None
+        else:
+            self.number = None
+            self._id = id_
+
+    def _get_id(self):
+        if self._id is None and self.number is not None:
+            self._id = '/%d' % (self.number,)
+
+        return self._id
+
+    id = property(_get_id)
+
     def __str__(self):
         return str(self.id)
 
@@ -156,26 +566,25 @@ class RequestWrapper(object):
         A response has been received by the gateway.
         """
         self.response = response
-        self.result = self.response.body
 
-        if isinstance(self.result, remoting.ErrorFault):
-            self.result.raiseException()
+        if isinstance(response.body, remoting.ErrorFault):
+            response.body.raiseException()
 
     def _get_result(self):
         """
-        Returns the result of the called remote request. If the request has not
-        yet been called, an C{AttributeError} exception is raised.
+        Returns the result (the response body) of the called remote request.
+        If the request has not yet been called, an C{AttributeError} exception
+        is raised.
         """
-        if not hasattr(self, '_result'):
+        try:
+            response = self.response
+        except AttributeError:
             raise AttributeError(
                 "'RequestWrapper' object has no attribute 'result'")
 
-        return self._result
+        return response.body
 
-    def _set_result(self, result):
-        self._result = result
-
-    result = property(_get_result, _set_result)
+    result = property(_get_result)
 
 
 class RemotingService(object):
@@ -185,8 +594,9 @@ class RemotingService(object):
     @ivar url: The url of the remote gateway. Accepts C{http} or C{https} as
         valid schemes.
     @type url: C{string}
-    @ivar requests: The list of pending requests to process.
-    @type requests: C{list}
+    @ivar requests: The pending requests to process, keyed on request number
+        in the order they were added.
+    @type requests: C{collections.OrderedDict}
     @ivar request_number: A unique identifier for tracking the number of
         requests.
     @ivar amf_version: The AMF version to use. See
@@ -205,9 +615,26 @@ class RemotingService(object):
     @type http_headers: L{dict}
     @ivar strict: Whether to use strict AMF en/decoding or not.
     @type strict: C{boolean}
+    @ivar use_ext: Whether to en/decode with the compiled C{cpyamf} extension.
+        If C{None} (the default) the extension is used when it is available,
+        if C{True} it is required, if C{False} the pure python codec is used.
+        See L{pyamf.get_encoder}.
+    @type use_ext: C{boolean} or C{None}
+    @ivar compress: Whether to gzip request bodies larger than
+        C{compress_threshold} bytes. The gateway must understand
+        C{Content-Encoding: gzip}. Default is C{False}.
+    @type compress: C{boolean}
+    @ivar compress_threshold: Minimum body size, in bytes, for compression to
+        kick in. Default is L{DEFAULT_COMPRESS_THRESHOLD}.
+    @type compress_threshold: C{int}
     @ivar opener: The function used to power the connection to the remote
-        server. Defaults to U{urllib2.urlopen<http://
-        docs.python.org/library/urllib2.html#urllib2.urlopen>}.
+        server. Defaults to a L{HTTPConnectionOpener}, which keeps the
+        connection to the gateway alive between requests. It honours the
+        proxy environment variables but, unlike C{urlopen}, does not follow
+        redirects nor use an opener installed with
+        C{urllib.request.install_opener}. Any callable with the same
+        signature as U{urllib.request.urlopen<http://docs.python.org/library/
+        urllib.request.html#urllib.request.urlopen>} can be used instead.
     @type opener: C{function}
     """
 
@@ -215,17 +642,26 @@ class RemotingService(object):
         self.original_url = url
         self.amf_version = amf_version
 
-        self.requests = []
+        self.requests = collections.OrderedDict()
+        self._by_key = {}
         self.request_number = 1
         self.headers = remoting.HeaderCollection()
         self.http_headers = {}
         self.proxy_args = None
+        self._services = {}
+        self._executor = None
+        self._executor_lock = threading.Lock()
 
         self.user_agent = kwargs.pop('user_agent', DEFAULT_USER_AGENT)
         self.referer = kwargs.pop('referer', None)
         self.strict = kwargs.pop('strict', False)
+        self.use_ext = kwargs.pop('use_ext', None)
         self.logger = kwargs.pop('logger', None)
-        self.opener = kwargs.pop('opener', urlopen)
+        self.compress = kwargs.pop('compress', False)
+        self.compress_threshold = kwargs.pop(
+            'compress_threshold', DEFAULT_COMPRESS_THRESHOLD
+        )
+        self.opener = kwargs.pop('opener', None) or HTTPConnectionOpener()
 
         if kwargs:
             raise TypeError('Unexpected keyword arguments %r' % (kwargs,))
@@ -236,8 +672,8 @@ class RemotingService(object):
         self.url = urlparse(url)
         self._root_url = url
 
-        if not self.url[0] in ('http', 'https'):
-            raise ValueError('Unknown scheme %r' % (self.url[0],))
+        if self.url.scheme not in HTTPConnectionOpener.connection_types:
+            raise ValueError('Unknown scheme %r' % (self.url.scheme,))
 
         if self.logger:
             self.logger.info('Connecting to %r', self._root_url)
@@ -249,8 +685,8 @@ class RemotingService(object):
         Set the proxy for all requests to use.
 
         @type type: C{string}
-        @see: U{The Python Docs<http://docs.python.org/library/urllib2.html#
-            urllib2.Request.set_proxy>}
+        @see: U{The Python Docs<http://docs.python.org/library/
+            urllib.request.html#urllib.request.Request.set_proxy>}
         """
         self.proxy_args = (host, type)
 
@@ -281,47 +717,85 @@ class RemotingService(object):
         Returns a L{ServiceProxy} for the supplied name. Sets up an object that
         can have method calls made to it that build the AMF requests.
 
+        The proxy is cached, so asking for the same service again returns the
+        same object.
+
         @type name: C{string}
         @type auto_execute: C{bool}
         @rtype: L{ServiceProxy}
         @raise TypeError: Unexpected type for string C{name}.
         """
+        try:
+            return self._services[name, auto_execute]
+        except KeyError:
+            pass
+
         if not isinstance(name, str):
             raise TypeError('string type required')
 
-        return ServiceProxy(self, name, auto_execute)
+        service = self._services[name, auto_execute] = ServiceProxy(
+            self, name, auto_execute
+        )
+
+        return service
 
     def getRequest(self, id_):
         """
         Gets a request based on the id.
 
+        @param id_: The request id (C{'/1'}) or request number (C{1}).
         @raise LookupError: Request C{id_} not found.
         """
-        for request in self.requests:
-            if request.id == id_:
-                return request
+        if isinstance(id_, str) and id_.startswith('/'):
+            try:
+                id_ = int(id_[1:])
+            except ValueError:
+                pass
 
-        raise LookupError("Request %r not found" % (id_,))
+        try:
+            return self.requests[id_]
+        except KeyError:
+            raise LookupError("Request %r not found" % (id_,))
 
     def addRequest(self, service, *args):
         """
         Adds a request to be sent to the remoting gateway.
         """
-        wrapper = RequestWrapper(
-            self,
-            '/%d' % self.request_number,
-            service,
-            *args
-        )
+        wrapper = RequestWrapper(self, self.request_number, service, *args)
 
         self.request_number += 1
-        self.requests.append(wrapper)
+        self.requests[wrapper.number] = wrapper
+
+        try:
+            self._by_key.setdefault((service, args), []).append(wrapper.number)
+        except TypeError:
+            # unhashable args, removeRequest will fall back to a search
+            pass
 
         if self.logger:
             self.logger.debug('Adding request %s%r', wrapper.service, args)
 
         return wrapper
 
+    def _findRequest(self, service, args):
+        """
+        Returns the number of the first pending request for C{service} called
+        with C{args}.
+
+        @raise LookupError: Request not found.
+        """
+        try:
+            ids = self._by_key.get((service, args), None)
+        except TypeError:
+            for request in self.requests.values():
+                if request.service == service and request.args == args:
+                    return request.number
+        else:
+            if ids:
+                return ids[0]
+
+        raise LookupError("Request not found")
+
     def removeRequest(self, service, *args):
         """
         Removes a request from the pending request list.
@@ -329,27 +803,34 @@ class RemotingService(object):
         @raise LookupError: Request not found.
         """
         if isinstance(service, RequestWrapper):
-            if self.logger:
-                self.logger.debug(
-                    'Removing request: %s',
-                    self.requests[self.requests.index(service)]
-                )
-            del self.requests[self.requests.index(service)]
+            number = service.number
 
-            return
+            # the same number may be pending on another RemotingService
+            if self.requests.get(number) is not service:
+                raise LookupError("Request %r not found" % (service,))
+        else:
+            number = self._findRequest(service, args)
 
-        for request in self.requests:
-            if request.service == service and request.args == args:
-                if self.logger:
-                    self.logger.debug(
-                        'Removing request: %s',
-                        self.requests[self.requests.index(request)]
-                    )
-                del self.requests[self.requests.index(request)]
+        try:
+            request = self.requests.pop(number)
+        except KeyError:
+            raise LookupError("Request %r not found" % (number,))
 
-                return
+        key = (request.service, request.args)
 
-        raise LookupError("Request not found")
+        try:
+            numbers = self._by_key.get(key, None)
+        except TypeError:
+            numbers = None
+
+        if numbers:
+            numbers.remove(number)
+
+            if not numbers:
+                del self._by_key[key]
+
+        if self.logger:
+            self.logger.debug('Removing request: %s', request)
 
     def getAMFRequest(self, requests):
         """
@@ -372,18 +853,62 @@ class RemotingService(object):
         return envelope
 
     def _get_execute_headers(self):
-        headers = self.http_headers.copy()
+        # urllib.request.Request normalises the case of header names, so the
+        # user's headers replace the defaults whatever case they are given in
+        headers = DEFAULT_HTTP_HEADERS.copy()
 
-        headers.update({
-            'Content-Type': remoting.CONTENT_TYPE,
-            'User-Agent': self.user_agent
-        })
+        headers.update(self.http_headers)
+        headers.update(EXECUTE_HEADERS)
+        headers['User-Agent'] = self.user_agent
 
         if self.referer is not None:
             headers['Referer'] = self.referer
 
         return headers
 
+    def _post(self, body):
+        """
+        Sends an encoded envelope to the gateway and returns the decoded
+        response envelope.
+        """
+        return self._getResponse(self._getHTTPRequest(body))
+
+    def _getHTTPRequest(self, body):
+        """
+        Builds the HTTP POST request for an encoded AMF envelope.
+
+        The stream is wrapped in a L{StreamBody} rather than copied into a
+        string first, and is sent in chunks. If L{compress} is set and the
+        body is large enough, it is gzipped instead.
+
+        @param body: The encoded envelope.
+        @type body: L{BufferedByteStream<pyamf.util.BufferedByteStream>}
+        @rtype: C{urllib.request.Request}
+        """
+        headers = self._get_execute_headers()
+
+        if gzip and self.compress and len(body) > self.compress_threshold:
+            data = gzip.compress(body.getvalue())
+            headers['Content-Encoding'] = 'gzip'
+
+            if self.logger:
+                self.logger.debug(
+                    'Compressed request body from %d to %d bytes',
+                    len(body), len(data)
+                )
+        else:
+            body.seek(0)
+            data = StreamBody(body)
+
+        headers['Content-Length'] = str(len(data))
+
+        http_request = Request(self._root_url, data, headers)
+
+        if self.proxy_args:
+            http_request.set_proxy(*self.proxy_args)
+
+        return http_request
+
     def execute_single(self, request):
         """
         Builds, sends and handles the response to a single request, returning
@@ -394,65 +919,140 @@ class RemotingService(object):
 
         self.removeRequest(request)
 
-        body = remoting.encode(
-            self.getAMFRequest([request]),
-            strict=self.strict
+        return self._executeRequest(request)
+
+    def _encodeSingle(self, request):
+        """
+        Encodes an envelope holding just C{request}. This is the single
+        request version of L{getAMFRequest}, used by L{execute_single}.
+        """
+        envelope = remoting.Envelope(self.amf_version)
+
+        if self.logger:
+            self.logger.debug('AMF version: %s' % self.amf_version)
+
+        envelope[request.id] = remoting.Request(
+            str(request.service),
+            list(request.args)
         )
+        envelope.headers = self.headers
 
-        http_request = Request(
-            self._root_url, body.getvalue(),
-            self._get_execute_headers()
+        return remoting.encode(
+            envelope,
+            strict=self.strict,
+            use_ext=self.use_ext
         )
 
-        if self.proxy_args:
-            http_request.set_proxy(*self.proxy_args)
+    def _executeRequest(self, request):
+        return self._post(self._encodeSingle(request))[request.id]
+
+    def execute_async(self, request):
+        """
+        Like L{execute_single} but the request is encoded, sent and its
+        response decoded on a background worker thread, so the caller can
+        prepare further requests while waiting on the network.
+
+        Requests submitted this way are executed one at a time, in the order
+        they were submitted. Avoid calling the other C{execute} methods while
+        asynchronous requests are in flight.
+
+        @return: A future that resolves to the response.
+        @rtype: C{concurrent.futures.Future}
+        @see: L{gather}
+        @since: 0.8.11
+        """
+        if self.logger:
+            self.logger.debug('Executing async request: %s', request)
+
+        self.removeRequest(request)
 
-        envelope = self._getResponse(http_request)
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = futures.ThreadPoolExecutor(max_workers=1)
 
-        return envelope[request.id]
+            return self._executor.submit(self._executeRequest, request)
+
+    def close(self):
+        """
+        Waits for any requests submitted with L{execute_async} to finish and
+        stops the background worker thread. A later call to L{execute_async}
+        starts a new one.
+
+        @since: 0.8.11
+        """
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown()
 
     def execute(self):
         """
         Builds, sends and handles the responses to all requests listed in
         C{self.requests}.
+
+        All pending requests are sent in a single AMF envelope, i.e. one HTTP
+        round trip no matter how many requests are pending. When making many
+        calls, get the service with C{auto_execute=False} and call this
+        method (or L{flush}) once, rather than paying a round trip per call.
         """
-        requests = self.requests[:]
+        requests = list(self.requests.values())
+
+        # everything is going, no need to unindex the requests one by one
+        self.requests.clear()
+        self._by_key.clear()
+
+        if self.logger:
+            self.logger.debug('Removed %d pending requests', len(requests))
+
+        return self._executeBatch(requests)
+
+    #: Alias for L{execute}.
+    flush = execute
+
+    def execute_batch(self, requests):
+        """
+        Builds, sends and handles the responses to the supplied list of
+        pending requests in a single AMF envelope. Any request in C{requests}
+        is removed from C{self.requests}.
+
+        @param requests: The L{RequestWrapper}s to send.
+        @type requests: C{list}
+        @return: The response envelope.
+        @rtype: L{Envelope<pyamf.remoting.Envelope>}
+        @raise LookupError: A request is not pending. No request is removed.
+        @since: 0.8.11
+        """
+        numbers = set()
+
+        # check them all up front so a bad entry does not drop the others
+        for r in requests:
+            if r.number in numbers or self.requests.get(r.number) is not r:
+                raise LookupError("Request %r not found" % (r,))
+
+            numbers.add(r.number)
 
         for r in requests:
             self.removeRequest(r)
 
+        return self._executeBatch(requests)
+
+    def _executeBatch(self, requests):
         body = remoting.encode(
             self.getAMFRequest(requests),
-            strict=self.strict
-        )
-
-        http_request = Request(
-            self._root_url, body.getvalue(),
-            self._get_execute_headers()
+            strict=self.strict,
+            use_ext=self.use_ext
         )
 
-        if self.proxy_args:
-            http_request.set_proxy(*self.proxy_args)
-
-        envelope = self._getResponse(http_request)
-
-        return envelope
+        return self._post(body)
 
-    def _getResponse(self, http_request):
-        """
-        Gets and handles the HTTP response from the remote gateway.
+    def _readResponse(self, fbh):
         """
-        if self.logger:
-            self.logger.debug('Sending POST request to %s', self._root_url)
-
-        try:
-            fbh = self.opener(http_request)
-        except URLError as e:
-            if self.logger:
-                self.logger.exception('Failed request for %s', self._root_url)
-
-            raise remoting.RemotingError(str(e))
+        Reads the body of the HTTP response from the remote gateway,
+        decompressing it if required.
 
+        @raise RemotingError: Unexpected content type or encoding.
+        """
         http_message = fbh.info()
 
         content_encoding = http_message.get('Content-Encoding')
@@ -467,30 +1067,65 @@ class RemotingService(object):
             self.logger.debug('Server: %r', server)
 
         if content_type.split(';')[0].strip() != remoting.CONTENT_TYPE:
+            body = fbh.read()
+
             if self.logger:
-                self.logger.debug('Body = %s', fbh.read())
+                self.logger.debug('Body = %s', body)
 
             raise remoting.RemotingError(
                 'Incorrect MIME type received. (got: %s)' % (content_type,)
             )
 
-        bytes = fbh.read(int(content_length))
+        content_length = int(content_length)
+
+        if content_length < 0:
+            bytes = fbh.read()
+        else:
+            bytes = fbh.read(content_length)
 
         if self.logger:
             self.logger.debug('Read %d bytes for the response', len(bytes))
 
         if content_encoding and content_encoding.strip().lower() == 'gzip':
-            if not GzipFile:
+            if not gzip:
                 raise remoting.RemotingError(
                     'Decompression of Content-Encoding: %s not available.' % (
                         content_encoding,))
 
-            compressedstream = BytesIO(bytes)
-            gzipper = GzipFile(fileobj=compressedstream)
-            bytes = gzipper.read()
-            gzipper.close()
+            bytes = gzip.decompress(bytes)
+
+        return bytes
+
+    def _getResponse(self, http_request):
+        """
+        Gets and handles the HTTP response from the remote gateway.
+        """
+        if self.logger:
+            self.logger.debug('Sending POST request to %s', self._root_url)
+
+        try:
+            fbh = self.opener(http_request)
+        except URLError as e:
+            if self.logger:
+                self.logger.exception('Failed request for %s', self._root_url)
+
+            if isinstance(e, HTTPError):
+                # releases the socket of the error response
+                e.close()
+
+            raise remoting.RemotingError(str(e))
 
-        response = remoting.decode(bytes, strict=self.strict)
+        try:
+            bytes = self._readResponse(fbh)
+        finally:
+            # hands a persistent connection back to the pool
+            fbh.close()
+
+        response = remoting.decode(
+            bytes,
+            strict=self.strict,
+            use_ext=self.use_ext
+        )
 
         if self.logger:
             self.logger.debug('Response: %s', response)
@@ -527,3 +1162,14 @@ class RemotingService(object):
             ),
             True
         )
+
+
+def gather(fs):
+    """
+    Waits for the futures returned by L{RemotingService.execute_async} and
+    returns their responses, in the same order.
+
+    @raise Exception: The first exception raised by a request.
+    @since: 0.8.11
+    """
+    return [f.result() for f in fs]
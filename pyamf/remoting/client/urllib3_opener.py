@@ -0,0 +1,100 @@
+# Copyright (c) The PyAMF Project.
+# See LICENSE.txt for details.
+
+"""
+U{urllib3<https://urllib3.readthedocs.io>} opener for the remoting client.
+
+urllib3 provides connection pooling, keep-alive and retries out of the box.
+To use it instead of the default
+L{HTTPConnectionOpener<pyamf.remoting.client.HTTPConnectionOpener>}::
+
+    from pyamf.remoting.client import RemotingService
+    from pyamf.remoting.client.urllib3_opener import Urllib3Opener
+
+    gw = RemotingService(url, opener=Urllib3Opener())
+
+Proxies are not taken from L{RemotingService.setProxy
+<pyamf.remoting.client.RemotingService.setProxy>}; pass a
+C{urllib3.ProxyManager} as the C{pool_manager} instead.
+
+@since: 0.8.11
+"""
+
+from urllib.error import HTTPError, URLError
+
+import urllib3
+
+
+class Urllib3Response(object):
+    """
+    Adapts a C{urllib3.response.HTTPResponse} to the C{urlopen} style response
+    that L{RemotingService<pyamf.remoting.client.RemotingService>} reads.
+
+    @ivar response: The wrapped response.
+    """
+
+    def __init__(self, response):
+        self.response = response
+
+    def info(self):
+        return self.response.headers
+
+    def read(self, amt=None):
+        # the remoting client deals with Content-Encoding itself
+        return self.response.read(amt, decode_content=False)
+
+    def close(self):
+        """
+        Releases the connection back to the pool, discarding any unread data.
+        """
+        self.response.drain_conn()
+        self.response.release_conn()
+
+
+class Urllib3Opener(object):
+    """
+    Sends C{urllib.request.Request} objects through a urllib3 pool manager.
+
+    @ivar pool_manager: Defaults to a C{urllib3.PoolManager} keeping up to 8
+        connections per host.
+    @type pool_manager: C{urllib3.PoolManager}
+    @ivar retries: Passed to C{urlopen}, see C{urllib3.util.Retry}. POST
+        requests are only retried when the connection could not be made.
+    """
+
+    def __init__(self, pool_manager=None, retries=1):
+        if pool_manager is None:
+            pool_manager = urllib3.PoolManager(maxsize=8, block=False)
+
+        self.pool_manager = pool_manager
+        self.retries = retries
+
+    def __call__(self, request):
+        if request.has_proxy() or request._tunnel_host:
+            raise URLError(
+                'Configure proxies on the urllib3 pool manager instead')
+
+        try:
+            response = self.pool_manager.urlopen(
+                request.get_method(),
+                request.full_url,
+                body=request.data,
+                headers=dict(request.header_items()),
+                retries=self.retries,
+                redirect=False,
+                preload_content=False,
+                decode_content=False
+            )
+        except urllib3.exceptions.HTTPError as e:
+            raise URLError(e)
+
+        if not 200 <= response.status < 300:
+            raise HTTPError(
+                request.full_url,
+                response.status,
+                response.reason,
+                response.headers,
+                Urllib3Response(response)
+            )
+
+        return Urllib3Response(response)
@@ -0,0 +1,82 @@
+# Copyright (c) The PyAMF Project.
+# See LICENSE.txt for details.
+
+"""
+Tests for the urllib3 remoting client opener.
+
+@since: 0.8.11
+"""
+
+import threading
+import unittest
+from http import server as http_server
+
+try:
+    from pyamf.remoting.client import urllib3_opener
+except ImportError:
+    urllib3_opener = None
+
+from pyamf import remoting
+from pyamf.remoting import client
+from pyamf.tests.remoting.test_client import GatewayRequestHandler
+
+
+class Urllib3OpenerTestCase(unittest.TestCase):
+    """
+    Tests for L{urllib3_opener.Urllib3Opener}.
+    """
+
+    def setUp(self):
+        if not urllib3_opener:
+            self.skipTest("'urllib3' is not available")
+
+        self.server = http_server.HTTPServer(
+            ('127.0.0.1', 0), GatewayRequestHandler
+        )
+        self.server.connections = set()
+        self.server.request_headers = []
+
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+        self.url = 'http://127.0.0.1:%d/gateway' % (self.server.server_port,)
+        self.opener = urllib3_opener.Urllib3Opener()
+        self.gw = client.RemotingService(self.url, opener=self.opener)
+
+    def tearDown(self):
+        self.opener.pool_manager.clear()
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    def test_execute_single(self):
+        service = self.gw.getService('baz', auto_execute=False)
+
+        for i in range(3):
+            response = self.gw.execute_single(service.gak())
+
+            self.assertEqual(response.status, remoting.STATUS_OK)
+            self.assertEqual(response.body, [1, 2, 3])
+
+        self.assertEqual(len(self.server.request_headers), 3)
+        self.assertEqual(len(self.server.connections), 1)
+
+    def test_execute(self):
+        baz = self.gw.getService('baz', auto_execute=False)
+        baz.gak()
+        baz.gak()
+
+        envelope = self.gw.execute()
+
+        self.assertEqual(envelope['/1'].body, [1, 2, 3])
+        self.assertEqual(envelope['/2'].body, [1, 2, 3])
+
+    def test_proxy(self):
+        self.gw.setProxy('127.0.0.1:3128')
+
+        self.assertRaises(
+            remoting.RemotingError,
+            self.gw.execute_single,
+            self.gw.getService('baz', auto_execute=False).gak()
+        )
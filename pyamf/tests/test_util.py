@@ -91,6 +91,22 @@ class StringIOTestCase(unittest.TestCase):
         self.assertEqual(sp.getvalue(), b'this is a test')
         self.assertEqual(len(sp), 14)
 
+        sp = util.BufferedByteStream(bytearray(b'spam'))
+        self.assertEqual(sp.tell(), 0)
+        self.assertEqual(sp.getvalue(), b'spam')
+        self.assertEqual(len(sp), 4)
+
+        sp = util.BufferedByteStream(memoryview(b'spameggs')[4:])
+        self.assertEqual(sp.tell(), 0)
+        self.assertEqual(sp.getvalue(), b'eggs')
+        self.assertEqual(len(sp), 4)
+
+        sp = util.BufferedByteStream(b'spam')
+        sp.seek(0, 2)
+        sp.write(b'eggs')
+        self.assertEqual(sp.getvalue(), b'spameggs')
+        self.assertEqual(len(sp), 8)
+
         self.assertRaises(TypeError, util.BufferedByteStream, self)
 
     def test_getvalue(self):
@@ -39,8 +39,10 @@ class BytesIOProxy(object):
         """
         self._buffer = BytesIO()
 
-        if isinstance(buf, bytes):
-            self._buffer.write(buf)
+        if isinstance(buf, (bytes, bytearray, memoryview)):
+            # BytesIO shares a bytes buffer until it is written to, so no copy
+            # of the (possibly large) incoming data is made
+            self._buffer = BytesIO(buf)
         elif isinstance(buf, str):
             self._buffer.write(buf.encode('utf-8'))
         elif hasattr(buf, 'getvalue'):